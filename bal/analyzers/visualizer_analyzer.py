@@ -1,8 +1,161 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
 from bal.context import BALContext
 from bal.context_ioc import AbstractAnalyzer
 from bal.data_model import ClassModel, ValueModel, DictModel, ArrayModel
 from bal.data_object import DataObject
 
+# Templates for the visualizer config nodes, in the order of their keys. Copying a small dict
+# and updating its values is cheaper than building the dict from a literal.
+_LEAF_TEMPLATE = {
+    "type": None,
+    "implementation": None,
+    "description": None,
+    "bit_size": None,
+    "unpacked": False,
+    "is_empty": None,
+}
+_VALUE_TEMPLATE = {
+    "type": None,
+    "implementation": None,
+    "description": None,
+    "bit_size": None,
+    "unpacked": True,
+    "value": None,
+    "is_empty": None,
+}
+_CONTAINER_TEMPLATE = {
+    "type": None,
+    "implementation": None,
+    "description": None,
+    "bit_size": None,
+    "unpacked": True,
+    "children": None,
+    "is_empty": True,
+}
+
+
+class LazyWrapper(Mapping):
+    """
+    A read-only visualizer config node that is built on demand. It holds the same keys as the
+    nodes built by :py:meth:`VisualizerAnalyzer.analyze`, but the data object is only unpacked
+    when one of its keys is first read, and the "children" list holds lazy wrappers that are not
+    unpacked until they are read in turn. A container's "is_empty" value is computed from its
+    children when it is read, stopping at the first child that is not empty. Use
+    :py:meth:`to_dict` to get native objects that can be serialized.
+
+    :param VisualizerAnalyzer analyzer: The analyzer used to build the node.
+    :param DataObject data_object: The data object represented by the node.
+    """
+    __slots__ = ("_analyzer", "_data_object", "_node", "_children", "_is_empty_pending")
+
+    def __init__(self, analyzer, data_object):
+        self._analyzer = analyzer
+        self._data_object = data_object
+        self._node = None  # type: Optional[Dict[str, Any]]
+        # Iterator over the child data objects until the "children" list is built
+        self._children = None  # type: Optional[Iterator[Tuple[Any, DataObject]]]
+        self._is_empty_pending = False
+
+    def _get_node(self):
+        """
+        Build the node for the data object without its children, unpacking the data object if
+        needed.
+
+        :rtype: Dict[str, Any]
+        """
+        if self._node is None:
+            self._node, self._children = self._analyzer._wrap(self._data_object)
+            self._is_empty_pending = self._children is not None
+        return self._node
+
+    def __getitem__(self, key):
+        """
+        :param str key:
+        :rtype: Any
+        """
+        node = self._get_node()
+        if key == "children" and self._children is not None:
+            node["children"].extend(
+                LazyWrapper(self._analyzer, child)
+                for _, child in self._children
+                if child is not None
+            )
+            self._children = None
+        elif key == "is_empty" and self._is_empty_pending:
+            self._reduce_is_empty()
+        return node[key]
+
+    def _reduce_is_empty(self):
+        """
+        Compute the "is_empty" value of the node and of the descendants it depends on. The
+        descendants are walked with an explicit stack, stopping at the first child that is not
+        empty, so that deep trees are not bounded by the interpreter's recursion limit.
+        """
+        stack = [(self, iter(self["children"]))]
+        # The "is_empty" value of the last node popped off the stack
+        is_empty = None
+        while stack:
+            wrapper, children = stack[-1]
+            if is_empty is False:
+                # A child is not empty, neither is its parent
+                wrapper._node["is_empty"] = False
+                wrapper._is_empty_pending = False
+                stack.pop()
+                continue
+            is_empty = None
+            for child in children:
+                child_node = child._get_node()
+                if child._is_empty_pending:
+                    stack.append((child, iter(child["children"])))
+                    break
+                if not child_node["is_empty"]:
+                    is_empty = False
+                    break
+            else:
+                wrapper._node["is_empty"] = True
+                wrapper._is_empty_pending = False
+                stack.pop()
+                is_empty = True
+
+    def to_dict(self):
+        """
+        Build the nested dicts for the node and all of its descendants, as
+        :py:meth:`VisualizerAnalyzer.analyze` does when it is not lazy. The result can be fed to
+        serialization libraries. The whole tree is unpacked, the descendants are walked with an
+        explicit stack.
+
+        :rtype: Dict[str, Any]
+        """
+        root = {}
+        stack = [(self, root)]
+        while stack:
+            wrapper, out = stack.pop()
+            for key in wrapper:
+                value = wrapper[key]
+                if key == "children":
+                    children = []
+                    for child in value:
+                        child_out = {}
+                        children.append(child_out)
+                        stack.append((child, child_out))
+                    value = children
+                out[key] = value
+        return root
+
+    def __iter__(self):
+        """
+        :rtype: Iterator[str]
+        """
+        return iter(self._get_node())
+
+    def __len__(self):
+        """
+        :rtype: int
+        """
+        return len(self._get_node())
+
 
 class VisualizerAnalyzer(AbstractAnalyzer):
     """
@@ -10,10 +163,36 @@ class VisualizerAnalyzer(AbstractAnalyzer):
     are used to configure the visualizer to display the bitstream.
 
     :param BALContext context: The configured context
+    :param bool skip_empty: If True, packed data objects whose bytes are all set to 0 are not
+        unpacked, they are represented as empty packed nodes instead.
     """
-    def __init__(self, context):
+    def __init__(self, context, skip_empty=False):
         super(VisualizerAnalyzer, self).__init__(context)
         self.context = context
+        self.skip_empty = skip_empty
+        # Names of the node builders for the model types met so far, see _get_handler
+        self._handler_names = {}  # type: Dict[type, str]
+
+    def analyze(self, lazy=False):
+        """
+        Build the visualizer config for the data of the context.
+
+        The lazy result is a read-only :py:class:`collections.abc.Mapping`. It can be indexed,
+        iterated and compared to dicts, and reading a key only unpacks the data objects needed
+        to answer it. It is not a dict, so serialization libraries such as :py:mod:`json`
+        reject it: call :py:meth:`LazyWrapper.to_dict` to get the native objects, which
+        unpacks the whole tree. The data objects must not be modified while the lazy result is
+        in use, the nodes that were already read are not updated.
+
+        :param bool lazy: If True, return a :py:class:`LazyWrapper` that unpacks the data
+            objects and builds the nodes as they are read instead of walking the whole tree
+            up front.
+        :rtype: Union[Dict[str, Any], LazyWrapper]
+        """
+        data_object = self.context.get_data()
+        if lazy:
+            return LazyWrapper(self, data_object)
+        return self._traverse(data_object)
 
     def _is_data_object_empty(self, data_object):
         """
@@ -22,58 +201,162 @@ class VisualizerAnalyzer(AbstractAnalyzer):
         :param DataObject data_object:
         :rtype: bool
         """
-        is_empty = True
-        for byte in data_object.get_bytes():
-            if byte == 0 or byte == b"\x00":
-                continue
-            is_empty = False
-            break
-        return is_empty
+        # any() walks the buffer in C and stops at the first non-zero byte
+        return not any(data_object.get_bytes())
 
-    def _traverse(self, data_object):
+    def _wrap_leaf(self, metadata, is_empty):
         """
-        Recurse through the descendant data objects, building a visualizer config node for each.
+        Build the visualizer config node for a data object that is not unpacked.
 
-        :param DataObject data_object:
+        :param Tuple[str, Optional[str], Optional[str], int] metadata: The model type,
+            implementation, description and bit size of the data object.
+        :param bool is_empty: True if the bytes of the data object are all set to 0.
         :rtype: Dict[str, Any]
         """
-        wrapper = {
-            "type": data_object.get_model_type(),
-            "implementation": data_object.get_model_implementation(),
-            "description": data_object.get_model_description(),
-            "bit_size": data_object.get_bit_size(),
-            "unpacked": data_object.is_convertible() or data_object.is_unpacked(),
-        }
+        wrapper = _LEAF_TEMPLATE.copy()
+        (
+            wrapper["type"],
+            wrapper["implementation"],
+            wrapper["description"],
+            wrapper["bit_size"],
+        ) = metadata
+        wrapper["is_empty"] = is_empty
+        return wrapper
 
-        if not data_object.is_convertible() and not data_object.is_unpacked():
-            wrapper["is_empty"] = self._is_data_object_empty(data_object)
-            return wrapper
-
-        data_model = data_object.unpack()
+    def _wrap_value(self, data_model, metadata):
+        """
+        Build the visualizer config node for a value model. The "value_name" and
+        "value_description" keys are only set if the model defines them.
 
-        if isinstance(data_model, ValueModel):
+        :param ValueModel data_model:
+        :param Tuple[str, Optional[str], Optional[str], int] metadata: The model type,
+            implementation, description and bit size of the data object.
+        :rtype: Tuple[Dict[str, Any], None]
+        """
+        value = data_model.get_value()
+        wrapper = _VALUE_TEMPLATE.copy()
+        (
+            wrapper["type"],
+            wrapper["implementation"],
+            wrapper["description"],
+            wrapper["bit_size"],
+        ) = metadata
+        wrapper["value"] = value
+        wrapper["is_empty"] = value == "" or value == 0
+        if data_model.value_name is not None:
             wrapper["value_name"] = data_model.value_name
+        if data_model.value_description is not None:
             wrapper["value_description"] = data_model.value_description
-            wrapper["value"] = data_model.get_value()
-            wrapper["is_empty"] = data_model.get_value() == "" or data_model.get_value() == 0
-        elif isinstance(data_model, ArrayModel):
-            wrapper["children"] = [
-                self._traverse(c)
-                for i, c in data_model.iterate()
-                if c is not None
-            ]
-            wrapper["is_empty"] = all([
-                item["is_empty"] is True for item in wrapper["children"]
-            ])
-        elif isinstance(data_model, DictModel) or isinstance(data_model, ClassModel):
-            wrapper["children"] = [
-                self._traverse(v)
-                for k, v in data_model.iterate()
-                if v is not None
-            ]
-            wrapper["is_empty"] = all([
-                item["is_empty"] is True for item in wrapper["children"]
-            ])
-        else:
-            raise ValueError("Unknown data object model")
-        return wrapper
\ No newline at end of file
+        return wrapper, None
+
+    def _wrap_container(self, data_model, metadata):
+        """
+        Build the visualizer config node for a model with children. The "children" list is left
+        empty and "is_empty" set to True, they are updated by :py:meth:`_traverse` as the
+        children are visited.
+
+        :param DataModel data_model:
+        :param Tuple[str, Optional[str], Optional[str], int] metadata: The model type,
+            implementation, description and bit size of the data object.
+        :rtype: Tuple[Dict[str, Any], Iterator[Tuple[Any, DataObject]]]
+        """
+        wrapper = _CONTAINER_TEMPLATE.copy()
+        (
+            wrapper["type"],
+            wrapper["implementation"],
+            wrapper["description"],
+            wrapper["bit_size"],
+        ) = metadata
+        wrapper["children"] = []
+        return wrapper, iter(data_model.iterate())
+
+    # Names of the node builder methods by model type. Names are stored rather than functions so
+    # that subclasses overriding the builders are dispatched to their overrides.
+    _HANDLERS = {
+        ValueModel: "_wrap_value",
+        ArrayModel: "_wrap_container",
+        DictModel: "_wrap_container",
+        ClassModel: "_wrap_container",
+    }
+
+    def _get_handler(self, ModelType):
+        """
+        Find the name of the node builder method for a model type and cache it on the analyzer.
+
+        :param Type[DataModel] ModelType:
+        :rtype: str
+        :raises ValueError: If the model type is not a known data model.
+        """
+        handler_name = self._HANDLERS.get(ModelType)
+        if handler_name is None:
+            if issubclass(ModelType, ValueModel):
+                handler_name = self._HANDLERS[ValueModel]
+            elif issubclass(ModelType, ArrayModel):
+                handler_name = self._HANDLERS[ArrayModel]
+            elif issubclass(ModelType, (DictModel, ClassModel)):
+                handler_name = self._HANDLERS[ClassModel]
+            else:
+                raise ValueError("Unknown data object model")
+        self._handler_names[ModelType] = handler_name
+        return handler_name
+
+    def _wrap(self, data_object):
+        """
+        Build the visualizer config node for a single data object, unpacking it if possible. The
+        children of the node are not visited: when the node has children, its "children" list is
+        left empty and an iterator over the child data objects is returned alongside it.
+
+        :param DataObject data_object:
+        :rtype: Tuple[Dict[str, Any], Optional[Iterator[Tuple[Any, DataObject]]]]
+        """
+        # Read before unpacking so the node describes the data object as it was found
+        metadata = data_object.get_metadata()
+
+        if not data_object.is_unpacked():
+            if not data_object.is_convertible():
+                return self._wrap_leaf(metadata, self._is_data_object_empty(data_object)), None
+            if self.skip_empty and self._is_data_object_empty(data_object):
+                # Zeroed data is not worth unpacking, it is shown as an empty packed node
+                return self._wrap_leaf(metadata, True), None
+
+        data_model = data_object.unpack()
+        handler_name = self._handler_names.get(type(data_model))
+        if handler_name is None:
+            handler_name = self._get_handler(type(data_model))
+        return getattr(self, handler_name)(data_model, metadata)
+
+    def _traverse(self, data_object):
+        """
+        Walk through the descendant data objects, building a visualizer config node for each. The
+        walk uses an explicit stack instead of recursion so that deeply nested models are not
+        bounded by the interpreter's recursion limit.
+
+        :param DataObject data_object:
+        :rtype: Dict[str, Any]
+        """
+        # This loop runs once per node, the bound methods are looked up once instead
+        wrap = self._wrap
+        root, children = wrap(data_object)
+        # Each entry holds a node whose children are still being visited
+        stack = [] if children is None else [(root, children)]
+        push = stack.append
+        while stack:
+            wrapper, children = stack[-1]
+            add_child = wrapper["children"].append
+            for _, child in children:
+                if child is None:
+                    continue
+                child_wrapper, grandchildren = wrap(child)
+                add_child(child_wrapper)
+                if grandchildren is not None:
+                    push((child_wrapper, grandchildren))
+                    break
+                if wrapper["is_empty"] and not child_wrapper["is_empty"]:
+                    wrapper["is_empty"] = False
+            else:
+                # All the children are visited, the node's emptiness is final and is reported to
+                # its parent
+                stack.pop()
+                if stack and not wrapper["is_empty"]:
+                    stack[-1][0]["is_empty"] = False
+        return root
@@ -1,8 +1,6 @@
-from abc import ABCMeta, abstractmethod
+from abc import abstractmethod
 from typing import Dict, Any, TypeVar
 
-import six
-
 from bal.context_ioc import BALIoCContext, BALIoCContextFactory
 from bal.data_object import DataObject
 
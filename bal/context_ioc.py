@@ -1,20 +1,19 @@
 import logging
 from abc import ABCMeta, abstractmethod
-from typing import Type, Any, TypeVar, Dict
-
-import six
+from typing import Type, Any, TypeVar, Dict, Optional
 
 T = TypeVar("T")
 LOGGER = logging.getLogger("bal")
 
 
-@six.add_metaclass(ABCMeta)
-class AbstractAnalyzer(object):
+class AbstractAnalyzer(metaclass=ABCMeta):
     """
     Analyze binary data to extract information.
 
     :param BALIoCContext context: The BAL context that can be read/modified by the analyzer.
     """
+    __slots__ = ("context",)
+
     def __init__(self, context):
         self.context = context
 
@@ -28,13 +27,14 @@ class AbstractAnalyzer(object):
         raise NotImplemented
 
 
-@six.add_metaclass(ABCMeta)
-class AbstractConverter(object):
+class AbstractConverter(metaclass=ABCMeta):
     """
     Converts bytes to data model and vice-versa. It is instantiated by the BAL context.
 
     :param BALIoCContext context: The BAL context that can be read/modified by the converter.
     """
+    __slots__ = ("context",)
+
     def __init__(self, context):
         self.context = context
 
@@ -48,6 +48,18 @@ class AbstractConverter(object):
         """
         raise NotImplemented
 
+    def unpack_batch(self, data_bytes_list):
+        """
+        Deserialize several models from bytes. :py:meth:`DataObject.unpack_all` calls it for
+        sibling data objects that share this converter instance. By default, each model is
+        unpacked with :py:meth:`unpack`, converters can override it to process the whole batch
+        at once.
+
+        :param List[bytes] data_bytes_list: The data to unpack
+        :rtype: List[DataModel]
+        """
+        return [self.unpack(data_bytes) for data_bytes in data_bytes_list]
+
     @abstractmethod
     def pack(self, data_model):
         """
@@ -58,14 +70,26 @@ class AbstractConverter(object):
         """
         raise NotImplemented
 
+    def pack_to(self, data_model, buf):
+        """
+        Serialize a model, appending the bytes to the provided buffer. By default, the model is
+        packed with :py:meth:`pack`. Converters can override it to have the children of the
+        model write to the buffer directly with :py:meth:`DataObject.pack_to`, so that nested
+        data objects are copied once instead of once per level.
+
+        :param DataModel data_model: The model to pack
+        :param bytearray buf: The buffer the bytes are appended to
+        """
+        buf += self.pack(data_model)
+
 
-@six.add_metaclass(ABCMeta)
-class AbstractModifier(object):
+class AbstractModifier(metaclass=ABCMeta):
     """
     Modifies binary data. It is instantiated by the BAL context.
 
     :param BALIoCContext context: The BAL context that can be used by the converter.
     """
+    __slots__ = ("context",)
 
     def __init__(self, context):
         self.context = context
@@ -107,6 +131,21 @@ class BALIoCContext(object):
         self._analyzers_by_type = analyzers_by_type
         self._modifiers_by_type = modifiers_by_type
 
+    def get_converter_interface(self, DataModelType):
+        # type: (Type[T]) -> Optional[Type[T]]
+        """
+        Find the interface a converter is registered for among the provided data model type and
+        its base classes, in method resolution order.
+
+        :param Type[DataModel] DataModelType: The type of a data model.
+        :rtype: Optional[Type[DataModel]]
+        """
+        converters_by_type = self._converters_by_type
+        for Interface in DataModelType.__mro__:
+            if Interface in converters_by_type:
+                return Interface
+        return None
+
     def create_converter(self, TargetDataModelType, *args, **kwargs):
         # type: (Type[T], Any, Any) -> T
         """
@@ -118,9 +157,7 @@ class BALIoCContext(object):
         """
         ConverterImplementation = self._converters_by_type.get(TargetDataModelType)
         if ConverterImplementation is None:
-            LOGGER.debug("No converter registered for interface {}".format(
-                TargetDataModelType.__name__
-            ))
+            LOGGER.debug("No converter registered for interface %s", TargetDataModelType.__name__)
             return None
         return ConverterImplementation(self, *args, **kwargs)
 
@@ -134,9 +171,7 @@ class BALIoCContext(object):
         """
         AnalyzerImplementation = self._analyzers_by_type.get(AnalyzerType)
         if AnalyzerImplementation is None:
-            LOGGER.debug("No analyzer registered for interface {}".format(
-                AnalyzerType.__name__
-            ))
+            LOGGER.debug("No analyzer registered for interface %s", AnalyzerType.__name__)
             return None
         return AnalyzerImplementation(self, *args, **kwargs)
 
@@ -150,9 +185,7 @@ class BALIoCContext(object):
         """
         ModifierImplementation = self._modifiers_by_type.get(ModifierType)
         if ModifierImplementation is None:
-            LOGGER.debug("No modifier registered for interface {}".format(
-                ModifierType.__name__
-            ))
+            LOGGER.debug("No modifier registered for interface %s", ModifierType.__name__)
             return None
         return ModifierImplementation(self, *args, **kwargs)
 
@@ -1,19 +1,45 @@
 import textwrap
 import typing
-from abc import ABCMeta, abstractmethod
-from collections import OrderedDict
-from typing import Dict, Generic, Optional, List, Iterator
-
-import six
+from abc import abstractmethod
+from typing import Callable, Dict, Generic, Optional, List, Iterator, Tuple
 
 T = typing.TypeVar("T")
 
+# Descriptions built from class docstrings, keyed by class
+_DESCRIPTIONS = {}  # type: Dict[type, Optional[str]]
+
+
+def _get_class_description(cls):
+    """
+    Build a single line description from the docstring of the provided class. Docstrings do not
+    change at run time so the result is computed once per class.
+
+    :param type cls:
+    :rtype: Optional[str]
+    """
+    try:
+        return _DESCRIPTIONS[cls]
+    except KeyError:
+        pass
+    docstring = cls.__doc__
+    if not docstring:
+        description = None
+    else:
+        description = " ".join(textwrap.dedent(docstring).split("\n")).strip(" ")
+    _DESCRIPTIONS[cls] = description
+    return description
+
 
 class DataModel(Generic[T]):
     """
     A data model defines the structure of data. This is an abstract definition that must be
     implemented for specific data types.
+
+    The models declare their attributes in `__slots__`, so attributes that are not declared
+    cannot be set on instances of the models defined here. Subclasses that do not declare
+    `__slots__` get a `__dict__` and accept any attribute.
     """
+    __slots__ = ("_synced", "__weakref__")
 
     def __init__(self):
         self._synced = True
@@ -48,10 +74,7 @@ class DataModel(Generic[T]):
 
         :rtype: Optional[str]
         """
-        docstring = type(self).__doc__
-        if not docstring:
-            return None
-        return " ".join(textwrap.dedent(docstring).split("\n")).strip(" ")
+        return _get_class_description(type(self))
 
     @abstractmethod
     def iterate(self):
@@ -73,23 +96,41 @@ class ClassModel(DataModel[T]):
     the model as a Python class, providing the iterate implementation. Any setters defined by the
     child class should set :py:attr:`self._synced` to False.
 
-    :param List[Tuple[str,Callable[[],T]]] getters: A list of getters for the
-        properties defined by the child class. Each item in the list is a tuple, the first item
-        is the name of the property, the second item is the getter.
+    The properties are either described for the whole class by setting :py:attr:`_CHILDREN`
+    to a tuple of `(name, getter)` items, each getter being called with the model, or for each
+    instance with the `getters` parameter. The class-level description avoids building the
+    getters for every instance.
+
+    :param Optional[Iterable[Tuple[str,Callable[[],T]]]] getters: The getters for the
+        properties defined by the child class. Each item is a tuple, the first item is the name
+        of the property, the second item is the getter. The getters are stored as a tuple. If
+        None, the properties are described by :py:attr:`_CHILDREN`.
     """
-    def __init__(self, getters):
+    __slots__ = ("_getters",)
+
+    # The (name, getter) items describing the properties of every instance of the class, used
+    # when no getters are provided to the constructor
+    _CHILDREN = ()  # type: Tuple[Tuple[str, Callable[[ClassModel[T]], T]], ...]
+
+    def __init__(self, getters=None):
         super(ClassModel, self).__init__()
-        self._getters = getters
+        if getters is not None:
+            getters = tuple(getters)
+        self._getters = getters  # type: Optional[Tuple[Tuple[str, Callable[[], T]], ...]]
 
     def iterate(self):
         """
-        Create an iterator for the object's properties. Each item is a tuple in which the fist
-        value is property name and the second value is the child.
+        Create an iterator for the object's properties. Each item is a tuple in which the first
+        value is the property name and the second value is the child.
 
         :rtype: Iterator[Tuple[str, T]]
         """
-        for k, getter in self._getters:
-            yield k, getter()
+        if self._getters is None:
+            for k, getter in self._CHILDREN:
+                yield k, getter(self)
+        else:
+            for k, getter in self._getters:
+                yield k, getter()
 
 
 class ValueModel(DataModel):
@@ -103,6 +144,7 @@ class ValueModel(DataModel):
     :param str value_name: A name for the value wrapped by the data object.
     :param str value_description: A description for the value wrapped by the data object
     """
+    __slots__ = ("_value", "value_name", "value_description")
 
     type = "Value"
 
@@ -158,7 +200,7 @@ class ValueModel(DataModel):
 
         :rtype: Iterator[]
         """
-        return iter([])
+        return iter(())
 
 
 class DictModel(DataModel[T]):
@@ -167,13 +209,14 @@ class DictModel(DataModel[T]):
     dictionary, it should be avoided as when the value types change as the typing information is
     lost.
 
-    :param OrderedDict[str,T] attributes: The dict data wrapped by the model.
+    :param Dict[str,T] attributes: The dict data wrapped by the model. The children are
+        iterated in the dict's insertion order.
     """
+    __slots__ = ("_attributes",)
+
     def __init__(self, attributes):
         super(DictModel, self).__init__()
-        if not isinstance(attributes, OrderedDict):
-            raise ValueError("The attributes should be an ordered dict")
-        self._attributes = attributes  # type: Optional[OrderedDict[str, T]]
+        self._attributes = attributes  # type: Dict[str, T]
 
     def iterate(self):
         """
@@ -235,6 +278,8 @@ class ArrayModel(DataModel[T]):
 
     :param List[T] items: The array wrapped by the model
     """
+    __slots__ = ("_items",)
+
     def __init__(self, items):
         super(ArrayModel, self).__init__()
         self._items = items  # type: List[T]
@@ -1,10 +1,8 @@
-import inspect
-import textwrap
 import typing
-from typing import TypeVar
+from typing import Dict, List, TypeVar
 
 from bal.context_ioc import BALIoCContext, AbstractConverter
-from bal.data_model import DataModel
+from bal.data_model import DataModel, _get_class_description
 
 T = TypeVar("T")
 
@@ -16,11 +14,24 @@ class DataObject(typing.Generic[T]):
 
     :param BALIoCContext context: The model wrapped by the data object
     :param T model: The model wrapped by the data object
-    :param bytes bytes: The bytes wrapped by the data object.
+    :param bytes bytes: The bytes wrapped by the data object. Any bytes-like object is accepted,
+        for instance a memoryview slice of the parent's bytes which avoids copying them. Note
+        that a bytearray cannot be resized while memoryviews of it are alive.
     :param AbstractConverter converter: The converter used to convert the model to bytes and back.
     :param int bit_size: The number of bits in the bytes. If the value is not provided,
         it is calculated from the bytes property.
     """
+    __slots__ = (
+        "_context",
+        "_synced",
+        "_bytes",
+        "_bit_size",
+        "_model",
+        "_ModelInterface",
+        "converter",
+        "__weakref__",
+    )
+
     def __init__(
             self,
             context,
@@ -55,13 +66,12 @@ class DataObject(typing.Generic[T]):
         
         :rtype DataObject[T]
         """
-        converter = None
-        ModelInterface = type(model)
-        for Interface in inspect.getmro(type(model)):
-            converter = context.create_converter(Interface)
-            if converter is not None:
-                ModelInterface = Interface
-                break
+        ModelInterface = context.get_converter_interface(type(model))
+        if ModelInterface is None:
+            converter = None
+            ModelInterface = type(model)
+        else:
+            converter = context.create_converter(ModelInterface)
         return DataObject(context, converter, ModelInterface, model, bytes, bit_size=bit_size)
 
     @staticmethod
@@ -111,9 +121,10 @@ class DataObject(typing.Generic[T]):
         """
         if self._bit_size is not None:
             return self._bit_size
-        elif not self.is_packed():
+        elif self._bytes is None:
             return 0
         else:
+            # Not stored in _bit_size, the bytes are replaced when the object is repacked
             return len(self._bytes) * 8
 
     def get_model_type(self):
@@ -142,17 +153,39 @@ class DataObject(typing.Generic[T]):
         """
         if self._model is not None:
             return self._model.get_description()
-        docstring = self._ModelInterface.__doc__
-        if not docstring:
-            return None
-        return " ".join(textwrap.dedent(docstring).split("\n")).strip(" ")
+        return _get_class_description(self._ModelInterface)
+
+    def get_metadata(self):
+        """
+        Get the model type, model implementation, model description and bit size of the data
+        object in a single call. It is equivalent to calling :py:meth:`get_model_type`,
+        :py:meth:`get_model_implementation`, :py:meth:`get_model_description` and
+        :py:meth:`get_bit_size`, for callers that need all of them for many data objects.
+
+        :rtype: Tuple[str, Optional[str], Optional[str], int]
+        """
+        model = self._model
+        if model is not None:
+            implementation = model.get_implementation()
+            description = model.get_description()
+        else:
+            implementation = None
+            description = self.get_model_description()
+        if self._bit_size is not None:
+            bit_size = self._bit_size
+        elif self._bytes is None:
+            bit_size = 0
+        else:
+            bit_size = len(self._bytes) * 8
+        return self._ModelInterface.__name__, implementation, description, bit_size
 
     def get_bytes(self):
         """
         Returns the bytes for the data object. This value may be outdated if pack hasn't been
-        called.
+        called. It is the bytes-like object the data object was created with, converters that
+        need an actual bytes instance should convert it.
 
-        :rtype: Optional[bytes]
+        :rtype: Optional[Union[bytes, bytearray, memoryview]]
         :raises ValueError: If the data object is not packed.
         :raises ValueError: If the data object's bytes are out of sync with the model.
         """
@@ -234,12 +267,46 @@ class DataObject(typing.Generic[T]):
             if not self.is_convertible():
                 return
             self.unpack()
-        for k, child in self._model.iterate():
-            if child is None:
-                continue
-            child.unpack_all()
+        # Depth-first walk with an explicit stack, the children are pushed in reverse so that
+        # they are unpacked in the same order as a recursive walk would
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if not node.is_unpacked():
+                if not node.is_convertible():
+                    continue
+                node.unpack()
+            children = [child for _, child in node._model.iterate() if child is not None]
+            # Grouping is only worth it when some children share a converter instance
+            if len(children) > 1 and \
+                    len({id(child.converter) for child in children}) < len(children):
+                DataObject._unpack_batches(children)
+            children.reverse()
+            stack.extend(children)
         return self._model
 
+    @staticmethod
+    def _unpack_batches(data_objects):
+        """
+        Unpack together the packed data objects that share the same converter instance, with a
+        single call to :py:meth:`AbstractConverter.unpack_batch`. Data objects that do not
+        share their converter are left as they are.
+
+        :param List[DataObject] data_objects:
+        """
+        batches = {}  # type: Dict[int, List[DataObject]]
+        for data_object in data_objects:
+            if data_object.converter is not None and not data_object.is_unpacked():
+                batches.setdefault(id(data_object.converter), []).append(data_object)
+        for batch in batches.values():
+            if len(batch) < 2:
+                continue
+            models = batch[0].converter.unpack_batch([
+                data_object._bytes for data_object in batch
+            ])
+            for data_object, model in zip(batch, models):
+                data_object.set_model(model)
+
     def pack(self):
         """
         Create and store a bytes representation of the data model stored on the data object. It
@@ -247,7 +314,7 @@ class DataObject(typing.Generic[T]):
         `Converter.pack()` usually means that the `pack()` method will be called recursively on
         all descendants that are out of sync.
 
-        :rtype: bytes, bool
+        :rtype: Union[bytes, bytearray, memoryview]
         :raises ValueError: If the data object is not convertible (ie no :py:class:`Converter`
             is set for data object).
         """
@@ -261,6 +328,29 @@ class DataObject(typing.Generic[T]):
         self._synced = True
         return self._bytes
 
+    def pack_to(self, buf):
+        """
+        Append a bytes representation of the data model stored on the data object to the
+        provided buffer. The bytes of data objects that are marked as synced, or that are not
+        unpacked, are copied as they are. The others are written to the buffer by their
+        converter with :py:meth:`AbstractConverter.pack_to`. Unlike :py:meth:`pack`, the
+        bytes are not stored on the data objects, which stay out of sync.
+
+        Just like :py:meth:`pack`, it should be preceded by a call to :py:meth:`synchronize`.
+
+        :param bytearray buf: The buffer the bytes are appended to
+        :raises ValueError: If the data object is not convertible (ie no :py:class:`Converter`
+            is set for data object).
+        """
+        if not self.is_unpacked() or (self._synced is True and self.is_packed()):
+            buf += self._bytes
+            return
+        if not self.is_convertible():
+            raise ValueError("No converter registered for data object {}".format(
+                self.get_model_type())
+            )
+        self.converter.pack_to(self._model, buf)
+
     def synchronize(self, force_desync=False):
         """
         Ensure that for a given data object, it is marked as out of sync if any of its
@@ -272,17 +362,62 @@ class DataObject(typing.Generic[T]):
 
         :param bool force_desync: If set to true, mark all children data object as out of sync.
         """
+        return self._synchronize(force_desync, False)
+
+    def synchronize_and_pack(self, force_desync=False):
+        """
+        Synchronize the data object then pack it, as :py:meth:`synchronize` followed by
+        :py:meth:`pack` would, in a single walk of the descendants. Each out of sync descendant
+        is repacked as soon as its own descendants are packed.
+
+        :param bool force_desync: If set to true, mark all children data object as out of sync.
+        :rtype: Union[bytes, bytearray, memoryview]
+        :raises ValueError: If an out of sync data object is not convertible.
+        """
+        self._synchronize(force_desync, True)
+        return self.pack()
+
+    def _synchronize(self, force_desync, pack):
+        """
+        Synchronize the data object and its descendants, optionally repacking the out of sync
+        ones on the way back up.
+
+        :param bool force_desync: If set to true, mark all children data object as out of sync.
+        :param bool pack: If set to true, pack the out of sync convertible data objects once
+            their descendants are synchronized.
+        :rtype: bool
+        """
         if not self.is_unpacked():
             self._synced = self._synced and not force_desync
             return self._synced
-        children_synced = True
-        for _, child in self._model.iterate():
-            if child is None:
-                continue
-            if child.synchronize(force_desync) is False:
-                children_synced = False
-        self._synced = children_synced and self._model._is_synced() and not force_desync
-        return self._synced
+        # The descendants are walked in post-order with an explicit stack. Each entry holds an
+        # unpacked data object, an iterator over its children and whether all of the children
+        # visited so far are synced.
+        stack = [[self, iter(self._model.iterate()), True]]
+        synced = True
+        while stack:
+            entry = stack[-1]
+            for _, child in entry[1]:
+                if child is None:
+                    continue
+                if child.is_unpacked():
+                    stack.append([child, iter(child._model.iterate()), True])
+                    break
+                child._synced = child._synced and not force_desync
+                if not child._synced:
+                    entry[2] = False
+            else:
+                stack.pop()
+                node = entry[0]
+                synced = entry[2] and node._model._is_synced() and not force_desync
+                node._synced = synced
+                if stack and not synced:
+                    stack[-1][2] = False
+                if pack and not synced and node.is_convertible():
+                    # The children are packed already, the converter reuses their bytes
+                    node._bytes = node.converter.pack(node._model)
+                    node._synced = True
+        return synced
 
     def to_str(self, indent_count=0, indent_size=2, recurse=True):
         """
@@ -293,29 +428,48 @@ class DataObject(typing.Generic[T]):
         :param bool recurse: If False, does not include child data in the string representation
         :rtype: str
         """
+        out = []
+        self._to_str_into(out, indent_count, indent_size, recurse)
+        return "".join(out)
+
+    def _to_str_into(self, out, indent_count, indent_size, recurse):
+        """
+        Append the fragments of the string representation of the data object to the provided
+        list. The descendants append to the same list, so the fragments are only joined once by
+        :py:meth:`to_str`.
+
+        :param List[str] out: The fragments of the string representation
+        :param int indent_count: The number of indents to use when rendering the object
+        :param int indent_size: The size (in spaces) of an indent
+        :param bool recurse: If False, does not include child data in the string representation
+        """
         if not self.is_unpacked():
-            return "Packed{}({})".format(self.get_model_type(), len(self._bytes))
+            out.append("Packed{}({})".format(self.get_model_type(), len(self._bytes)))
+            return
 
         model_type = self.get_model_type()
-        model_children = list(self._model.iterate())
-        if len(model_children) > 0:
-            indent = " " * indent_count * indent_size
-            values_str_parts = []
-            for key, value in model_children:
-                values_str_parts.extend([
-                    indent + " " * indent_size,
-                    str(key),
-                    ": ",
-                    value.to_str(indent_count + 1, indent_size,
-                                 recurse) if value is not None else "None",
-                    ", \n"
-                ])
-            model_str = "{\n" + "".join(values_str_parts) + indent + "}"
+        if model_type is not None:
+            out.append(model_type + "(")
+        indent = " " * indent_count * indent_size
+        child_indent = indent + " " * indent_size
+        start = len(out)
+        out.append("{\n")
+        for key, value in self._model.iterate():
+            out.append(child_indent)
+            out.append(str(key))
+            out.append(": ")
+            if value is not None:
+                value._to_str_into(out, indent_count + 1, indent_size, recurse)
+            else:
+                out.append("None")
+            out.append(", \n")
+        if len(out) > start + 1:
+            out.append(indent + "}")
         else:
-            model_str = str(self._model)
-        if model_type is None:
-            return model_str
-        return "{}({})".format(model_type, model_str)
+            # No children, the model renders itself
+            out[start] = str(self._model)
+        if model_type is not None:
+            out.append(")")
 
     def __str__(self):
         return self.to_str()
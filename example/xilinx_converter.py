@@ -1,22 +1,33 @@
-import six
-
 from bal.context_ioc import AbstractConverter
 from bal.data_object import DataObject
 from example.xilinx_model import XilinxBitstream, XilinxBitstreamHeaderInterface, \
     XilinxBitstreamSyncMarkerInterface, XilinxPacketsInterface
 
+# The sync word separating the bitstream header from the configuration packets
+_SYNC_MARKER = b"\xaa\x99\x55\x66"
+# Number of bytes of a memoryview copied at a time when searching it for the sync marker
+_SEARCH_CHUNK_SIZE = 4096
+
 
-def hex_to_bytes(hex):
+def _find(data_bytes, sub):
     """
-    Convert a hex value to the bytes representation used by the interpreter.
+    Find the first occurrence of `sub` in a bytes-like object. Memoryviews have no find method,
+    they are searched one chunk at a time so that only the bytes up to the match are copied.
 
-    :param str hex:
-    :rtype: bytes
+    :param Union[bytes, bytearray, memoryview] data_bytes:
+    :param bytes sub:
+    :rtype: int
     """
-    if six.PY2:
-        return hex.decode("hex")
-    else:
-        return bytes.fromhex(hex)
+    if not isinstance(data_bytes, memoryview):
+        return data_bytes.find(sub)
+    data_view = data_bytes.cast("B")
+    # Consecutive chunks overlap so that a match straddling two chunks is found
+    overlap = len(sub) - 1
+    for start in range(0, len(data_view), _SEARCH_CHUNK_SIZE):
+        index = data_view[start:start + _SEARCH_CHUNK_SIZE + overlap].tobytes().find(sub)
+        if index >= 0:
+            return start + index
+    return -1
 
 
 class XilinxBitstreamConverter(AbstractConverter):
@@ -31,28 +42,42 @@ class XilinxBitstreamConverter(AbstractConverter):
         self.context = context
 
     def unpack(self, data_bytes):
-        sync_marker = hex_to_bytes("AA995566")
-        sync_marker_index = data_bytes.find(sync_marker)
-        assert sync_marker_index >= 0, \
-            "The sync marker is not present in the provided bitstream data"
+        """
+        The children wrap memoryview slices of `data_bytes` rather than copies. When
+        `data_bytes` is a bytearray, it cannot be resized while the children reference it.
 
-        assert sync_marker_index + len(sync_marker) < len(data_bytes) - 2, \
-            "The configuration data is expected to contain at least one word size worth of data"
+        :param Union[bytes, bytearray, memoryview] data_bytes:
+        :rtype: XilinxBitstream
+        """
+        sync_marker = _SYNC_MARKER
+        # The search stops at the first match, right after the header, so it only scans the
+        # header. The header length is not a multiple of the word size in general, which rules
+        # out searching word by word.
+        sync_marker_index = _find(data_bytes, sync_marker)
+        if sync_marker_index < 0:
+            raise ValueError("The sync marker is not present in the provided bitstream data")
+        if sync_marker_index + len(sync_marker) >= len(data_bytes) - 2:
+            raise ValueError(
+                "The configuration data is expected to contain at least one word size worth of "
+                "data"
+            )
 
+        # The children wrap views of the bitstream bytes instead of copies
+        data_view = memoryview(data_bytes)
         return XilinxBitstream(
             DataObject.create_packed(
                 self.context,
-                data_bytes[:sync_marker_index],
+                data_view[:sync_marker_index],
                 XilinxBitstreamHeaderInterface
             ),
             DataObject.create_packed(
                 self.context,
-                data_bytes[sync_marker_index:sync_marker_index+len(sync_marker)],
+                data_view[sync_marker_index:sync_marker_index+len(sync_marker)],
                 XilinxBitstreamSyncMarkerInterface,
             ),
             DataObject.create_packed(
                 self.context,
-                data_bytes[sync_marker_index + len(sync_marker):],
+                data_view[sync_marker_index + len(sync_marker):],
                 XilinxPacketsInterface,
             )
         )
@@ -63,8 +88,19 @@ class XilinxBitstreamConverter(AbstractConverter):
         :rtype: bytes
         """
         assert isinstance(data_model, XilinxBitstream)
-        return b"".join([
+        # join sizes the result once and copies each part into it, with no intermediate buffer
+        return b"".join((
             data_model.get_header().pack(),
-            self.context.format.sync_word,
-            data_model.get_packets().pack()
-        ])
\ No newline at end of file
+            data_model.get_sync_marker().pack(),
+            data_model.get_packets().pack(),
+        ))
+
+    def pack_to(self, data_model, buf):
+        """
+        :param XilinxBitstream data_model:
+        :param bytearray buf:
+        """
+        assert isinstance(data_model, XilinxBitstream)
+        data_model.get_header().pack_to(buf)
+        data_model.get_sync_marker().pack_to(buf)
+        data_model.get_packets().pack_to(buf)
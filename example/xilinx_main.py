@@ -2,15 +2,14 @@ from example.xilinx_context import XilinxContextFactory
 from example.xilinx_converter import XilinxBitstreamConverter
 from example.xilinx_model import XilinxBitstream
 
-import wget
+from urllib.request import urlopen
 
 def run():
     context_factory = XilinxContextFactory()
     # Register the XilinxBitsreamConverter
     context_factory.register_converter(XilinxBitstream, XilinxBitstreamConverter)
-    lx9_bin = wget.download('https://redballoonsecurity.com/files/JwfEU4veQSNFao8h/lx9.bin')
-    with open(lx9_bin, "rb") as f:
-        data = f.read()
+    with urlopen('https://redballoonsecurity.com/files/JwfEU4veQSNFao8h/lx9.bin') as response:
+        data = response.read()
     context = context_factory.create(data)
     bitstream_object = context.get_data()
     print("Bitstream object: {}".format(bitstream_object))
@@ -1,3 +1,5 @@
+import operator
+
 from bal.data_model import DataModel, ClassModel
 from bal.data_object import DataObject
 
@@ -6,24 +8,35 @@ class XilinxPacketsInterface(DataModel):
     """
     An array of Xilinx register configuration packet.
     """
+    __slots__ = ()
 
 
 class XilinxBitstreamHeaderInterface(DataModel):
     """
     The Xilinx bitstream header contains unknown information.
     """
+    __slots__ = ()
 
 
 class  XilinxBitstreamSyncMarkerInterface(DataModel):
     """
     The Xilinx bitstream sync marker
     """
+    __slots__ = ()
 
 
 class XilinxBitstream(ClassModel[DataObject]):
     """
     The root model for a Xilinx bitstream. It contains a header and packets data objects.
     """
+    __slots__ = ("header", "sync_marker", "packets")
+
+    # The children are the same for every bitstream, the getters are shared by all instances
+    _CHILDREN = (
+        ("header", operator.attrgetter("header")),
+        ("sync_marker", operator.attrgetter("sync_marker")),
+        ("packets", operator.attrgetter("packets")),
+    )
 
     def __init__(
             self,
@@ -36,11 +49,7 @@ class XilinxBitstream(ClassModel[DataObject]):
         :param DataObject[XilinxBitstreamSyncMarker] sync_marker:
         :param DataObject[XilinxPackets] packets:
         """
-        super(XilinxBitstream, self).__init__((
-            ("header", self.get_header),
-            ("sync_marker", self.get_sync_marker),
-            ("packets", self.get_packets),
-        ))
+        super(XilinxBitstream, self).__init__()
         self.header = header
         self.sync_marker = sync_marker
         self.packets = packets
@@ -14,13 +14,9 @@ setup(
         'bal.analyzers'
     ],
     include_package_data=True,
-    install_requires=[
-        'enum34;python_version<"3.4"',
-        'typing;python_version<"3.5"',
-        'six',
-    ],
+    python_requires='>=3.7',
+    install_requires=[],
     extras_require={
         'docs': ['sphinx', 'sphinx-rtd-theme', 'm2r'],
-        'examples': ['wget']
     }
 )